@@ -0,0 +1,69 @@
+# Copyright 2023 Lawrence Livermore National Security, LLC and other
+# HPCIC DevTools Developers. See the top-level COPYRIGHT file for details.
+#
+# SPDX-License-Identifier: (MIT)
+
+import re
+from datetime import datetime
+
+# Written by boot_step in templates/boot_header.sh
+boot_log = "/var/log/flux-burst-boot.log"
+step_regex = re.compile(
+    r"FLUXBURST_BOOT_STEP (?P<name>\S+) (?P<event>start|end|skip|fail) (?P<timestamp>[0-9.]+)"
+)
+
+
+def new_phase(name, start=None, end=None):
+    """
+    A boot phase, updated as markers are parsed.
+    """
+    return {"name": name, "start": start, "end": end, "skipped": False, "failed": False}
+
+
+def parse_boot_timeline(output, created=None):
+    """
+    Parse boot step markers from a boot log (or console output).
+
+    Returns an ordered list of phases with start, end, and duration in
+    seconds. If the instance creation timestamp is provided, a first
+    "provision" phase covers the time from creation to the boot start.
+    """
+    matches = list(step_regex.finditer(output))
+
+    # Console output repeats on a reboot, so only parse the last boot
+    boot_starts = [
+        i
+        for i, match in enumerate(matches)
+        if match.group("name") == "boot" and match.group("event") == "start"
+    ]
+    if boot_starts:
+        matches = matches[boot_starts[-1] :]
+
+    steps = {}
+    for match in matches:
+        name = match.group("name")
+        event = match.group("event")
+        step = steps.setdefault(name, new_phase(name))
+        timestamp = float(match.group("timestamp"))
+        if event == "skip":
+            step["skipped"] = True
+            step["start"] = step["end"] = timestamp
+        elif event == "fail":
+            step["failed"] = True
+            step["end"] = timestamp
+        else:
+            step[event] = timestamp
+
+    boot = steps.pop("boot", None)
+    phases = list(steps.values())
+    if created and boot and boot["start"] is not None:
+        created = datetime.fromisoformat(created).timestamp()
+        phases.insert(0, new_phase("provision", start=created, end=boot["start"]))
+    if boot:
+        phases.append(boot)
+
+    for phase in phases:
+        phase["duration"] = None
+        if phase["start"] is not None and phase["end"] is not None:
+            phase["duration"] = round(phase["end"] - phase["start"], 3)
+    return phases
@@ -0,0 +1,72 @@
+# Copyright 2023 Lawrence Livermore National Security, LLC and other
+# HPCIC DevTools Developers. See the top-level COPYRIGHT file for details.
+#
+# SPDX-License-Identifier: (MIT)
+
+import json
+import shutil
+import subprocess
+
+# Like terraform, these commands assume gcloud is installed and authenticated
+
+
+def run_command(*args):
+    """
+    Run a gcloud command and return the output, raising on failure.
+    """
+    gcloud = shutil.which("gcloud")
+    if not gcloud:
+        raise ValueError("gcloud is required to inspect Compute Engine instances.")
+    result = subprocess.run(
+        [gcloud] + list(args), stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    )
+    if result.returncode != 0:
+        raise ValueError(
+            f"Error running gcloud {' '.join(args)}: {result.stderr.decode('utf-8')}"
+        )
+    return result.stdout.decode("utf-8")
+
+
+def list_instances(project, zone, name_prefix):
+    """
+    List compute instances (as dicts) with a name prefix in a zone.
+    """
+    output = run_command(
+        "compute",
+        "instances",
+        "list",
+        f"--project={project}",
+        f"--zones={zone}",
+        f"--filter=name ~ ^{name_prefix}-",
+        "--format=json",
+    )
+    return json.loads(output)
+
+
+def get_serial_port_output(project, zone, name):
+    """
+    Get the serial port (console) output for an instance.
+    """
+    return run_command(
+        "compute",
+        "instances",
+        "get-serial-port-output",
+        name,
+        f"--project={project}",
+        f"--zone={zone}",
+    )
+
+
+def delete_instances(project, zone, names):
+    """
+    Delete one or more compute instances in a zone.
+    """
+    return run_command(
+        "compute",
+        "instances",
+        "delete",
+        *names,
+        f"--project={project}",
+        f"--zone={zone}",
+        "--quiet",
+    )
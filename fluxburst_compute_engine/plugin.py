@@ -6,6 +6,7 @@
 import base64
 import os
 import tempfile
+import time
 from dataclasses import dataclass, field
 from typing import List, Optional
 
@@ -14,6 +15,9 @@ from fluxburst.logger import logger
 from fluxburst.plugins import BurstPlugin
 from python_terraform import IsFlagged
 
+import fluxburst_compute_engine.boot as boot
+import fluxburst_compute_engine.gcloud as gcloud
+import fluxburst_compute_engine.preemption as preemption
 import fluxburst_compute_engine.templates as templates
 import fluxburst_compute_engine.terraform as terraform
 
@@ -66,9 +70,19 @@ class BurstParameters:
     compute_machine_arch: Optional[str] = "x86-64"
     compute_machine_type: Optional[str] = "c2-standard-8"
 
+    # Provisioning model: standard (on-demand), spot, or mixed
+    compute_provisioning_model: Optional[str] = "standard"
+
+    # For a mixed provisioning model, the fraction (0-1) of nodes that are Spot
+    compute_spot_ratio: Optional[float] = 0.5
+
     # This builds from converged-computing/flux-terraform-gcp/build-images/bursted
     compute_family: Optional[str] = "flux-fw-bursted-x86-64"
 
+    # Boot steps already baked into the compute_family image, skipped at boot
+    # See image_capabilities in templates (e.g., nfs-utils, nfs-server)
+    compute_image_capabilities: List = field(default_factory=list)
+
     # Compact mode
     compute_compact: Optional[bool] = False
 
@@ -90,6 +104,15 @@ class FluxBurstComputeEngine(BurstPlugin):
     # Set our custom dataclass, otherwise empty
     _param_dataclass = BurstParameters
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # Target number of compute nodes for the burst, set on resize
+        self.node_count = None
+
+        # Preempted instances we have replaced, with latency
+        self.preemptions = []
+
     def generate_hostlist_range(self, size):
         """
         Generate the range for the hostlist (e.g., [0-2])
@@ -118,7 +141,9 @@ class FluxBurstComputeEngine(BurstPlugin):
             "LEAD_BROKER_ADDRESS": self.params.lead_host,
             "LEAD_BROKER_PORT": str(self.params.lead_port),
         }
-        template = templates.get_script("burst_boot.sh", replace)
+        template = templates.get_boot_script(
+            "burst", replace, self.params.compute_image_capabilities
+        )
         self.params.compute_boot_script = template
 
     def load_encoded_curve_cert(self):
@@ -140,15 +165,15 @@ class FluxBurstComputeEngine(BurstPlugin):
         """
         Generate a bursted broked config.
         """
-        # Generate range of hosts, numbered 1-N
-        hostrange = "001"
-        if node_count > 1:
-            # zfill 3 will produce 4 -> 004
-            end = str(node_count).zfill(3)
-            hostrange = f"[001-{end}]"
-
-        # Default pattern of hostnames
-        hosts = f"{self.params.compute_name_prefix}-{hostrange}"
+        # Default pattern of hostnames, one range per provisioning model
+        hosts = []
+        for model, count in terraform.split_provisioning(
+            self.params, node_count
+        ).items():
+            if count:
+                prefix = terraform.get_name_prefix(self.params, model)
+                hosts.append(self.generate_hostnames(prefix, count))
+        hosts = ",".join(hosts)
         curve_cert = self.load_encoded_curve_cert()
 
         # We call this a poor man's jinja2!
@@ -157,9 +182,22 @@ class FluxBurstComputeEngine(BurstPlugin):
             "NODELIST": hosts,
             "CURVECERT": curve_cert,
         }
-        template = templates.get_script("default_boot.sh", replace)
+        template = templates.get_boot_script(
+            "default", replace, self.params.compute_image_capabilities
+        )
         self.params.compute_boot_script = template
 
+    def generate_hostnames(self, prefix, count):
+        """
+        Generate the hostnames for a prefix, numbered 1-N
+        """
+        hostrange = "001"
+        if count > 1:
+            # zfill 3 will produce 4 -> 004
+            end = str(count).zfill(3)
+            hostrange = f"[001-{end}]"
+        return f"{prefix}-{hostrange}"
+
     def generate_resource_hostlist(self):
         """
         Generate the hostlist for the resource spec and the broker.toml.
@@ -195,7 +233,19 @@ class FluxBurstComputeEngine(BurstPlugin):
             # For now, assuming one burst will be done to run all jobs,
             # we just get the max size. This is obviously not ideal
             node_count = max([v["nnodes"] for _, v in self.jobs.items()])
+        try:
+            self.resize(node_count)
+        except ValueError as e:
+            logger.exit(str(e))
+
+    def resize(self, node_count):
+        """
+        Create or resize the bursted cluster to a number of compute nodes.
 
+        Applying the plan also recreates any instances that were deleted,
+        which is how preempted instances are replaced. Raises a ValueError
+        if terraform fails.
+        """
         # If we don't have an isolated burst, generate a broker config
         hosts = None
         if not self.params.isolated_burst:
@@ -223,7 +273,7 @@ class FluxBurstComputeEngine(BurstPlugin):
         print(f"Running terraform init for plan {self.params.terraform_plan_name}...")
         retval, _, _ = tf.init(capture_output=False)
         if retval != 0:
-            logger.exit(
+            raise ValueError(
                 f"Error running terraform init for plan {self.params.terraform_plan_name} in {self.params.terraform_dir}, see output above."
             )
 
@@ -238,9 +288,138 @@ class FluxBurstComputeEngine(BurstPlugin):
         # TODO add capture_output=False so we can see
         retval, _, _ = tf.apply(skip_plan=True, capture_output=False)
         if retval != 0:
-            logger.exit(
+            raise ValueError(
                 f"Error running terraform apply for plan {self.params.terraform_plan_name} in {self.params.terraform_dir}, see output above."
             )
+        self.node_count = node_count
+
+    def get_preemption_source(self):
+        """
+        Get the default preemption source, instances on Compute Engine.
+
+        The expected instance names are derived from the current target size.
+        """
+        return preemption.ComputeEnginePreemptionSource(
+            self.params.project,
+            self.params.zone,
+            self.params.compute_name_prefix,
+            expected=terraform.get_instance_names(self.params, self.node_count or 0),
+        )
+
+    def replace_preempted(self, source=None, resize=None):
+        """
+        Detect preempted instances and request replacements with a resize.
+
+        The source defaults to Compute Engine, and can be a simulated
+        preemption source. The resize defaults to applying the terraform
+        plan, and is called with the target node count. Returns the names
+        of replaced instances.
+        """
+        if not self.node_count:
+            logger.warning("There is no bursted cluster to replace instances for.")
+            return []
+
+        source = source or self.get_preemption_source()
+        resize = resize or self.resize
+        preempted = source.preempted()
+        if not preempted:
+            return []
+
+        names = [instance["name"] for instance in preempted]
+        logger.warning(f"Instances {', '.join(names)} were preempted, replacing.")
+        detected = time.time()
+        source.release(names)
+
+        # Resize back to the target so the cluster size converges
+        resize(self.node_count)
+        replaced = time.time()
+        for instance in preempted:
+            preempted_at = instance["preempted_at"] or detected
+            self.preemptions.append(
+                {
+                    "name": instance["name"],
+                    "preempted_at": preempted_at,
+                    "replaced_at": replaced,
+                    "latency": round(replaced - preempted_at, 3),
+                }
+            )
+        return names
+
+    def watch_preemptions(self, interval=60, timeout=None, source=None, resize=None):
+        """
+        Check for and replace preempted instances every interval seconds.
+
+        If a timeout (in seconds) is not set, watch until interrupted. An
+        error in one check (e.g., gcloud or terraform) is logged, and the
+        instances are found again on the next check. The default source is
+        created for each check, so it follows changes to the target size.
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        while True:
+            try:
+                self.replace_preempted(source or self.get_preemption_source(), resize)
+            except ValueError as e:
+                logger.warning(f"Error replacing preempted instances: {e}")
+            if deadline is not None and time.time() + interval > deadline:
+                break
+            time.sleep(interval)
+        return self.preemption_stats()
+
+    def preemption_stats(self):
+        """
+        Summarize preemptions and replacement latency (seconds).
+        """
+        latencies = [x["latency"] for x in self.preemptions]
+        if not latencies:
+            return {"preemptions": 0, "latency_mean": None, "latency_max": None}
+        return {
+            "preemptions": len(latencies),
+            "latency_mean": round(sum(latencies) / len(latencies), 3),
+            "latency_max": max(latencies),
+        }
+
+    def boot_timeline(self):
+        """
+        Collect the per-phase boot timeline for each bursted compute node.
+
+        The boot steps are timestamped to the console, so we parse them
+        from the serial port output, along with the instance creation time.
+        """
+        timelines = {}
+        instances = gcloud.list_instances(
+            self.params.project, self.params.zone, self.params.compute_name_prefix
+        )
+        for instance in instances:
+            output = gcloud.get_serial_port_output(
+                self.params.project, self.params.zone, instance["name"]
+            )
+            timelines[instance["name"]] = boot.parse_boot_timeline(
+                output, created=instance.get("creationTimestamp")
+            )
+        return timelines
+
+    def report_boot_timeline(self):
+        """
+        Log the boot timeline for each bursted compute node, and return it.
+        """
+        timelines = self.boot_timeline()
+        for name, phases in timelines.items():
+            logger.info(f"Boot timeline for {name}:")
+            for phase in phases:
+                if phase["skipped"]:
+                    logger.info(f"  {phase['name']}: skipped (provided by image)")
+                elif phase["failed"]:
+                    elapsed = (
+                        f" after {phase['duration']}s" if phase["duration"] else ""
+                    )
+                    logger.warning(
+                        f"  {phase['name']}: failed{elapsed}, see {boot.boot_log} on {name}"
+                    )
+                elif phase["duration"] is None:
+                    logger.info(f"  {phase['name']}: not finished")
+                else:
+                    logger.info(f"  {phase['name']}: {phase['duration']}s")
+        return timelines
 
     def validate_params(self):
         """
@@ -258,6 +437,37 @@ class FluxBurstComputeEngine(BurstPlugin):
         if not self.params.isolated_burst:
             self.params.terraform_plan_name = "burst"
 
+        if self.params.compute_provisioning_model not in terraform.provisioning_models:
+            logger.error(
+                f"Provisioning model {self.params.compute_provisioning_model} is not known, choices are standard, spot, or mixed."
+            )
+            return False
+
+        # The ratio is only used by a mixed burst, and can be a string from the environment
+        if self.params.compute_provisioning_model == "mixed":
+            try:
+                self.params.compute_spot_ratio = float(self.params.compute_spot_ratio)
+            except (TypeError, ValueError):
+                self.params.compute_spot_ratio = None
+            if (
+                self.params.compute_spot_ratio is None
+                or not 0 <= self.params.compute_spot_ratio <= 1
+            ):
+                logger.error("The compute spot ratio must be a number between 0 and 1.")
+                return False
+
+        # The capabilities can be a comma separated string from the environment
+        capabilities = self.params.compute_image_capabilities or []
+        if isinstance(capabilities, str):
+            capabilities = [x.strip() for x in capabilities.split(",") if x.strip()]
+        self.params.compute_image_capabilities = capabilities
+        for capability in capabilities:
+            if capability not in templates.image_capabilities:
+                logger.error(
+                    f"Image capability {capability} is not known, choices are {templates.image_capabilities}"
+                )
+                return False
+
         if self.params.munge_key and not os.path.exists(self.params.munge_key):
             logger.error(f"Munge key {self.params.munge_key} does not exist.")
             return False
@@ -0,0 +1,102 @@
+# Copyright 2023 Lawrence Livermore National Security, LLC and other
+# HPCIC DevTools Developers. See the top-level COPYRIGHT file for details.
+#
+# SPDX-License-Identifier: (MIT)
+
+import abc
+import time
+from datetime import datetime
+
+import fluxburst_compute_engine.gcloud as gcloud
+
+# A Spot instance preempted with the STOP termination action is stopped
+# (TERMINATED) or suspended, and with DELETE it is no longer listed
+preempted_states = ["STOPPING", "TERMINATED", "SUSPENDING", "SUSPENDED"]
+
+
+class PreemptionSource(abc.ABC):
+    """
+    A source of preempted instances.
+
+    preempted returns a list of {"name": ..., "preempted_at": ...} with
+    preempted_at as a timestamp (or None if unknown), and release is
+    called with the names before replacements are requested.
+    """
+
+    @abc.abstractmethod
+    def preempted(self):
+        pass
+
+    @abc.abstractmethod
+    def release(self, names):
+        pass
+
+
+class ComputeEnginePreemptionSource(PreemptionSource):
+    """
+    Detect preempted Spot instances with gcloud.
+
+    An instance is preempted if it is a stopped Spot instance, or if it is
+    one of the expected instance names and no longer exists. Preempted
+    instances that still exist are deleted on release, so the next
+    terraform apply recreates them.
+    """
+
+    def __init__(self, project, zone, name_prefix, expected=None):
+        self.project = project
+        self.zone = zone
+        self.name_prefix = name_prefix
+        self.expected = expected or []
+        self.existing = set()
+
+    def preempted(self):
+        preempted = []
+        instances = gcloud.list_instances(self.project, self.zone, self.name_prefix)
+        self.existing = set(instance["name"] for instance in instances)
+        for name in self.expected:
+            if name not in self.existing:
+                preempted.append({"name": name, "preempted_at": None})
+
+        for instance in instances:
+            scheduling = instance.get("scheduling", {})
+            if scheduling.get("provisioningModel") != "SPOT":
+                continue
+            if instance.get("status") not in preempted_states:
+                continue
+            preempted_at = instance.get("lastStopTimestamp")
+            if preempted_at:
+                preempted_at = datetime.fromisoformat(preempted_at).timestamp()
+            preempted.append({"name": instance["name"], "preempted_at": preempted_at})
+        return preempted
+
+    def release(self, names):
+        names = [name for name in names if name in self.existing]
+        if names:
+            gcloud.delete_instances(self.project, self.zone, names)
+
+
+class SimulatedPreemptionSource(PreemptionSource):
+    """
+    A simulated preemption source, e.g., for testing replacement logic.
+
+    Call preempt with an instance name, and it is reported as preempted
+    until it is released.
+    """
+
+    def __init__(self):
+        self.instances = {}
+        self.released = []
+
+    def preempt(self, name, preempted_at=None):
+        self.instances[name] = preempted_at or time.time()
+
+    def preempted(self):
+        return [
+            {"name": name, "preempted_at": preempted_at}
+            for name, preempted_at in self.instances.items()
+        ]
+
+    def release(self, names):
+        for name in names:
+            self.instances.pop(name, None)
+            self.released.append(name)
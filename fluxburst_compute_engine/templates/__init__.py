@@ -9,6 +9,41 @@ import fluxburst.utils as utils
 
 here = os.path.dirname(os.path.abspath(__file__))
 
+# Capabilities a compute image can declare as already baked in. A boot
+# step that provides one of these is skipped when the image declares it.
+image_capabilities = {
+    # nfs-utils is installed
+    "nfs-utils",
+    # /var/nfs/home is exported, firewall opened, nfs-server enabled
+    "nfs-server",
+    # the flux user has passwordless sudo
+    "flux-sudoers",
+    # imp.toml is written and flux-imp is setuid
+    "flux-imp",
+}
+
+# Ordered boot steps (under steps/) shared by each kind of boot script. A
+# {kind} in the script name is filled with the kind (burst or default).
+# Steps can use these placeholders, replaced by the plugin:
+# CURVECERT: base64 encoded curve certificate
+# NODELIST: with complete list of nodes
+# LOGLEVEL: desired flux log level
+# MUNGEKEY: base64 encoded munge key (burst only)
+# LEAD_BROKER_ADDRESS / LEAD_BROKER_PORT (burst only)
+boot_kinds = ["burst", "default"]
+boot_steps = [
+    {"name": "nfs-utils", "script": "nfs_utils.sh", "capability": "nfs-utils"},
+    {"name": "nfs-server", "script": "nfs_server.sh", "capability": "nfs-server"},
+    {"name": "flux-sudoers", "script": "flux_sudoers.sh", "capability": "flux-sudoers"},
+    {"name": "resources", "script": "resources.sh"},
+    {"name": "flux-imp", "script": "flux_imp.sh", "capability": "flux-imp"},
+    {"name": "broker-config", "script": "{kind}_broker_config.sh"},
+    {"name": "credentials", "script": "{kind}_credentials.sh"},
+    {"name": "run-dir", "script": "run_dir.sh"},
+    {"name": "flux-start", "script": "{kind}_flux_service.sh"},
+    {"name": "broker-join", "script": "broker_join.sh"},
+]
+
 
 def get_script(name, replace):
     """
@@ -21,3 +56,26 @@ def get_script(name, replace):
     for key, value in replace.items():
         template = template.replace(key, value)
     return template
+
+
+def get_boot_script(kind, replace, capabilities=None):
+    """
+    Generate a boot script from the boot steps for a kind of boot.
+
+    Each step is wrapped in timestamped start / end markers, and steps
+    already satisfied by the image capabilities are skipped (but still
+    recorded) so the boot timeline shows them.
+    """
+    if kind not in boot_kinds:
+        raise ValueError(f"Boot script kind {kind} is not known.")
+    capabilities = capabilities or []
+    script = get_script("boot_header.sh", {})
+    for step in boot_steps:
+        name = step["name"]
+        if step.get("capability") in capabilities:
+            script += f"\n# {name} is provided by the image\nboot_step {name} skip\n"
+            continue
+        script_name = step["script"].format(kind=kind)
+        content = get_script(os.path.join("steps", script_name), replace)
+        script += f"\nboot_step {name} start\n{content}boot_step {name} end\n"
+    return script + "\nboot_step boot end\n"
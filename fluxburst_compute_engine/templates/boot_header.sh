@@ -0,0 +1,36 @@
+#!/bin/sh
+
+# Bursted node boot, generated from an ordered manifest of steps.
+# Each step is timestamped to the boot log and the console (serial port)
+# so the plugin can collect a per-phase boot timeline.
+
+set -eEu -o pipefail
+
+boot_log=/var/log/flux-burst-boot.log
+current_step=boot
+
+# Usage: boot_step <name> <start|end|skip|fail>
+boot_step() {
+    echo "FLUXBURST_BOOT_STEP $1 $2 $(date +%s.%N)" | tee -a ${boot_log}
+    if [ "$2" = "start" ]; then
+        current_step=$1
+    elif [ "$2" = "end" ]; then
+        current_step=boot
+    fi
+}
+
+# A failed command exits (set -e), so record the step it failed in
+trap 'boot_step ${current_step} fail' ERR
+
+boot_step boot start
+
+# This is already built into the image
+fluxuser=flux
+fluxuid=$(id -u ${fluxuser})
+
+# IMPORTANT - this needs to match the local cluster
+fluxroot=/usr
+
+echo "Flux username: ${fluxuser}"
+echo "Flux install root: ${fluxroot}"
+export fluxroot
@@ -0,0 +1,17 @@
+# flux-start.service is Type=simple, so wait for the broker to join the
+# instance (reach the run state) before the boot is considered done
+broker_timeout=600
+joined=false
+for i in $(seq 1 ${broker_timeout}); do
+    if sudo -u ${fluxuser} FLUX_URI=local:///run/flux/local flux uptime 2>/dev/null | grep -q " run "; then
+        joined=true
+        break
+    fi
+    sleep 1
+done
+
+if [ "${joined}" != "true" ]; then
+    echo "Broker did not join within ${broker_timeout} seconds"
+    false
+fi
+echo "Broker joined"
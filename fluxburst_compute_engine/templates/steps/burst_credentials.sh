@@ -0,0 +1,15 @@
+sudo chown -R ${fluxuser}:${fluxuser} ${fluxroot}/etc/flux/system/conf.d
+
+# Munge key and curve certificate are base64 encoded by the plugin
+mkdir -p /etc/munge
+rm -rf /etc/munge/munge.key
+echo "MUNGEKEY" | base64 -d > /etc/munge/munge.key
+echo "CURVECERT" | base64 -d > /tmp/curve.cert
+
+chmod u=r,g=,o= /etc/munge/munge.key
+chown munge:munge /etc/munge/munge.key
+
+mv /tmp/curve.cert ${fluxroot}/etc/flux/system/curve.cert
+chmod u=r,g=,o= ${fluxroot}/etc/flux/system/curve.cert
+chown ${fluxuser}:${fluxuser} ${fluxroot}/etc/flux/system/curve.cert
+service munge start > /dev/null 2>&1
@@ -0,0 +1,33 @@
+mkdir -p /etc/flux/manager
+
+cat << "FIRST_BOOT_UNIT" > /etc/systemd/system/flux-start.service
+[Unit]
+Description=Flux message broker
+Wants=munge.service
+
+[Service]
+Type=simple
+NotifyAccess=main
+TimeoutStopSec=90
+KillMode=mixed
+ExecStart=/bin/bash -c '/usr/bin/flux broker --config-path /usr/etc/flux/system/conf.d -Scron.directory=/usr/etc/flux/system/conf.d -Stbon.fanout=256  -Srundir=/run/flux -Sbroker.rc2_none -Sstatedir=/var/lib/flux -Slocal-uri=local:///run/flux/local -Stbon.connect_timeout=5s -Stbon.zmqdebug=1  -Slog-stderr-level=LOGLEVEL -Slog-stderr-mode=local'
+SyslogIdentifier=flux
+Restart=always
+RestartSec=5s
+RestartPreventExitStatus=42
+SuccessExitStatus=42
+User=flux
+Group=flux
+RuntimeDirectory=flux
+RuntimeDirectoryMode=0755
+StateDirectory=flux
+StateDirectoryMode=0700
+PermissionsStartOnly=true
+Delegate=yes
+
+[Install]
+WantedBy=multi-user.target
+FIRST_BOOT_UNIT
+
+systemctl enable flux-start.service
+systemctl start flux-start.service
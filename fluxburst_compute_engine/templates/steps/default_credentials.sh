@@ -0,0 +1,11 @@
+# sudo chown -R ${fluxuser}:${fluxuser} ${fluxroot}/etc/flux/system/conf.d
+
+# The curve certificate is base64 encoded by the plugin
+echo "CURVECERT" | base64 -d > /tmp/curve.cert
+
+mv /tmp/curve.cert ${fluxroot}/etc/flux/system/curve.cert
+chmod u=r,g=,o= ${fluxroot}/etc/flux/system/curve.cert
+chown ${fluxuser}:${fluxuser} ${fluxroot}/etc/flux/system/curve.cert
+# munge.key gets shipped with image, needs to be same / shared
+# /usr/sbin/create-munge-key
+service munge start
@@ -0,0 +1,27 @@
+cat << "FIRST_BOOT_UNIT" > /etc/systemd/system/flux-start.service
+[Unit]
+Description=Flux message broker
+Wants=munge.service
+
+[Service]
+Type=simple
+NotifyAccess=main
+TimeoutStopSec=90
+KillMode=mixed
+ExecStart=/usr/bin/flux start --broker-opts --config /usr/etc/flux/system/conf.d -Stbon.fanout=256  -Srundir=/run/flux -Sbroker.rc2_none -Sstatedir=/var/lib/flux -Slocal-uri=local:///run/flux/local -Stbon.connect_timeout=5s -Stbon.zmqdebug=1  -Slog-stderr-level=7 -Slog-stderr-mode=local
+SyslogIdentifier=flux
+Restart=always
+RestartSec=5s
+RestartPreventExitStatus=42
+SuccessExitStatus=42
+User=flux
+Group=flux
+PermissionsStartOnly=true
+Delegate=yes
+
+[Install]
+WantedBy=multi-user.target
+FIRST_BOOT_UNIT
+
+systemctl enable flux-start.service
+systemctl start flux-start.service
@@ -0,0 +1,14 @@
+mkdir -p /etc/flux/imp/conf.d/
+cat <<EOT >> /etc/flux/imp/conf.d/imp.toml
+[exec]
+allowed-users = [ "${fluxuser}", "root" ]
+allowed-shells = [ "${fluxroot}/libexec/flux/flux-shell" ]
+EOT
+
+printf "\n🦊 Independent Minister of Privilege\n"
+cat /etc/flux/imp/conf.d/imp.toml
+
+# If we are communicating via the flux uri this service needs to be started
+chmod u+s ${fluxroot}/libexec/flux/flux-imp
+chmod 4755 ${fluxroot}/libexec/flux/flux-imp
+chmod 0644 /etc/flux/imp/conf.d/imp.toml
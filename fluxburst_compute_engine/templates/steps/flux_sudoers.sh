@@ -0,0 +1,2 @@
+echo "${fluxuser} ALL=(ALL) NOPASSWD: ALL" >> /etc/sudoers
+printf "${fluxuser} user identifiers:\n$(id ${fluxuser})\n"
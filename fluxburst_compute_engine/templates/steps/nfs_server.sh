@@ -0,0 +1,9 @@
+mkdir -p /var/nfs/home
+chown nobody:nobody /var/nfs/home
+
+echo "/var/nfs/home *(rw,no_subtree_check,no_root_squash)" >> /etc/exports
+
+firewall-cmd --add-service={nfs,nfs3,mountd,rpc-bind} --permanent
+firewall-cmd --reload
+
+systemctl enable --now nfs-server rpcbind
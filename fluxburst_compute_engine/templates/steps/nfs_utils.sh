@@ -0,0 +1,2 @@
+# Prepare NFS
+dnf install nfs-utils -y
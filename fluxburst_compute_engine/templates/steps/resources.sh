@@ -0,0 +1,9 @@
+export STATE_DIR=/var/lib/flux
+mkdir -p ${STATE_DIR}
+mkdir -p ${fluxroot}/etc/flux/system/conf.d
+
+# --cores=IDS Assign cores with IDS to each rank in R, so we  assign 0-(N-1) to each host
+echo "flux R encode --hosts=NODELIST"
+flux R encode --hosts=NODELIST --local > ${fluxroot}/etc/flux/system/R
+printf "\n📦 Resources\n"
+cat ${fluxroot}/etc/flux/system/R
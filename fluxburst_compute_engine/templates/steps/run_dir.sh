@@ -0,0 +1,12 @@
+# The rundir needs to be created first, and owned by user flux
+# Along with the state directory and curve certificate
+mkdir -p /run/flux
+sudo chown -R ${fluxuser}:${fluxuser} /run/flux
+
+# Remove group and other read
+chmod o-r ${fluxroot}/etc/flux/system/curve.cert
+chmod g-r ${fluxroot}/etc/flux/system/curve.cert
+chown -R ${fluxuid} /run/flux ${STATE_DIR} ${fluxroot}/etc/flux/system/curve.cert
+
+printf "\n✨ Curve certificate generated by helper pod\n"
+cat ${fluxroot}/etc/flux/system/curve.cert
@@ -3,6 +3,7 @@
 #
 # SPDX-License-Identifier: (MIT)
 
+import math
 import os
 import shutil
 
@@ -14,29 +15,92 @@ here = os.path.dirname(os.path.abspath(__file__))
 recipes = os.path.join(here, "tf")
 
 
+# Provisioning models for compute nodes
+provisioning_models = ["standard", "spot", "mixed"]
+
+# Preempted Spot instances are stopped, and deleted before replacement
+spot_termination_action = "STOP"
+
+
+def split_provisioning(params, compute_nodes_needed):
+    """
+    Split the compute nodes needed into on-demand (standard) and Spot counts.
+
+    For a mixed burst, the Spot count rounds half up (0.5 of 5 nodes is 3).
+    """
+    if params.compute_provisioning_model == "spot":
+        return {"standard": 0, "spot": compute_nodes_needed}
+    if params.compute_provisioning_model == "mixed":
+        spot = math.floor(compute_nodes_needed * params.compute_spot_ratio + 0.5)
+        return {"standard": compute_nodes_needed - spot, "spot": spot}
+    return {"standard": compute_nodes_needed, "spot": 0}
+
+
+def get_name_prefix(params, model):
+    """
+    Get the compute name prefix for a provisioning model.
+
+    Standard nodes keep the compute name prefix, and Spot nodes in a mixed
+    burst need their own so the instance names do not collide.
+    """
+    if model == "spot" and params.compute_provisioning_model == "mixed":
+        return f"{params.compute_name_prefix}-spot"
+    return params.compute_name_prefix
+
+
+def get_instance_names(params, compute_nodes_needed):
+    """
+    Get the expected compute instance names, numbered 1-N per prefix.
+    """
+    names = []
+    for model, instances in split_provisioning(params, compute_nodes_needed).items():
+        prefix = get_name_prefix(params, model)
+        names += [f"{prefix}-{str(i).zfill(3)}" for i in range(1, instances + 1)]
+    return names
+
+
 def generate_variables(params, compute_nodes_needed):
     """
     Given params from the burst plugin, generate terraform variables.
     """
     if params.terraform_plan_name != "burst":
         raise ValueError(f"Plan name {params.terraform_plan_name} is not supported.")
-    compute_node_specs = {
-        "name_prefix": params.compute_name_prefix,
-        "machine_arch": params.compute_machine_arch,
-        "machine_type": params.compute_machine_type,
-        "instances": compute_nodes_needed,
-        "properties": [],
-        "gpu_count": params.gpu_count,
-        "gpu_type": params.gpu_type,
-        "compact": params.compute_compact,
-        "boot_script": params.compute_boot_script,
-    }
+
+    # Standard nodes are created by the cluster module, and Spot nodes by spot.tf
+    counts = split_provisioning(params, compute_nodes_needed)
+    compute_node_specs = []
+    if counts["standard"]:
+        compute_node_specs.append(
+            {
+                "name_prefix": get_name_prefix(params, "standard"),
+                "machine_arch": params.compute_machine_arch,
+                "machine_type": params.compute_machine_type,
+                "instances": counts["standard"],
+                "properties": [],
+                "gpu_count": params.gpu_count,
+                "gpu_type": params.gpu_type,
+                "compact": params.compute_compact,
+                "boot_script": params.compute_boot_script,
+            }
+        )
+    spot_node_specs = []
+    if counts["spot"]:
+        spot_node_specs.append(
+            {
+                "name_prefix": get_name_prefix(params, "spot"),
+                "machine_type": params.compute_machine_type,
+                "instances": counts["spot"],
+                "boot_script": params.compute_boot_script,
+                "termination_action": spot_termination_action,
+            }
+        )
     return {
         "project_id": params.project,
         "network_name": params.network_name,
         "region": params.region,
         "zone": params.zone,
-        "compute_node_specs": [compute_node_specs],
+        "compute_node_specs": compute_node_specs,
+        "spot_node_specs": spot_node_specs,
         "compute_scopes": params.compute_scopes,
         "compute_family": params.compute_family,
     }
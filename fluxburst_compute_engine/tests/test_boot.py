@@ -0,0 +1,97 @@
+# Copyright 2023 Lawrence Livermore National Security, LLC and other
+# HPCIC DevTools Developers. See the top-level COPYRIGHT file for details.
+#
+# SPDX-License-Identifier: (MIT)
+
+import fluxburst_compute_engine.boot as boot
+import fluxburst_compute_engine.templates as templates
+from fluxburst_compute_engine.plugin import BurstParameters, FluxBurstComputeEngine
+
+replace = {
+    "NODELIST": "gffw-compute-a-[001-002]",
+    "LOGLEVEL": "7",
+    "CURVECERT": "Y3VydmU=",
+    "MUNGEKEY": "bXVuZ2U=",
+    "LEAD_BROKER_ADDRESS": "10.0.0.1",
+    "LEAD_BROKER_PORT": "8050",
+}
+
+
+def test_boot_script_skips_capabilities():
+    script = templates.get_boot_script("burst", replace, ["nfs-utils", "flux-imp"])
+    assert "boot_step nfs-utils skip" in script
+    assert "boot_step flux-imp skip" in script
+    assert "dnf install nfs-utils" not in script
+    assert "imp.toml" not in script
+
+    # Every step that is not skipped is wrapped in start / end
+    for step in templates.boot_steps:
+        if step["name"] in ["nfs-utils", "flux-imp"]:
+            assert f"boot_step {step['name']} start" not in script
+            continue
+        start = script.index(f"boot_step {step['name']} start")
+        assert script.index(f"boot_step {step['name']} end") > start
+    assert script.rstrip().endswith("boot_step boot end")
+
+
+def test_boot_script_kinds():
+    for kind in templates.boot_kinds:
+        script = templates.get_boot_script(kind, replace)
+        assert " skip\n" not in script
+        assert "gffw-compute-a-[001-002]" in script
+
+
+def test_parse_boot_timeline():
+    output = """
+FLUXBURST_BOOT_STEP boot start 100.0
+FLUXBURST_BOOT_STEP nfs-utils skip 100.5
+FLUXBURST_BOOT_STEP resources start 101.0
+FLUXBURST_BOOT_STEP resources end 104.5
+FLUXBURST_BOOT_STEP boot end 110.0
+"""
+    phases = boot.parse_boot_timeline(output, created="1970-01-01T00:01:00+00:00")
+    durations = {phase["name"]: phase["duration"] for phase in phases}
+    assert [phase["name"] for phase in phases] == [
+        "provision",
+        "nfs-utils",
+        "resources",
+        "boot",
+    ]
+    assert durations == {
+        "provision": 40.0,
+        "nfs-utils": 0.0,
+        "resources": 3.5,
+        "boot": 10.0,
+    }
+    assert phases[1]["skipped"]
+
+
+def test_parse_boot_timeline_last_boot_failed():
+    output = """
+FLUXBURST_BOOT_STEP boot start 100.0
+FLUXBURST_BOOT_STEP nfs-utils skip 100.5
+FLUXBURST_BOOT_STEP resources start 101.0
+FLUXBURST_BOOT_STEP resources end 102.0
+FLUXBURST_BOOT_STEP boot end 103.0
+FLUXBURST_BOOT_STEP boot start 200.0
+FLUXBURST_BOOT_STEP nfs-utils start 200.5
+FLUXBURST_BOOT_STEP nfs-utils end 201.0
+FLUXBURST_BOOT_STEP resources start 201.0
+FLUXBURST_BOOT_STEP resources fail 203.0
+"""
+    phases = {phase["name"]: phase for phase in boot.parse_boot_timeline(output)}
+    assert not phases["nfs-utils"]["skipped"]
+    assert phases["nfs-utils"]["duration"] == 0.5
+    assert phases["resources"]["failed"]
+    assert phases["resources"]["duration"] == 2.0
+    assert phases["boot"]["end"] is None
+
+
+def test_image_capabilities_from_environment(monkeypatch, tmp_path):
+    monkeypatch.setenv("FLUXBURST_COMPUTE_IMAGE_CAPABILITIES", "nfs-utils, nfs-server")
+    params = BurstParameters(
+        project="project", isolated_burst=True, terraform_dir=str(tmp_path)
+    )
+    plugin = FluxBurstComputeEngine(params)
+    assert plugin.validate_params()
+    assert plugin.params.compute_image_capabilities == ["nfs-utils", "nfs-server"]
@@ -0,0 +1,131 @@
+# Copyright 2023 Lawrence Livermore National Security, LLC and other
+# HPCIC DevTools Developers. See the top-level COPYRIGHT file for details.
+#
+# SPDX-License-Identifier: (MIT)
+
+import time
+
+import pytest
+
+import fluxburst_compute_engine.preemption as preemption
+from fluxburst_compute_engine.plugin import BurstParameters, FluxBurstComputeEngine
+
+
+def get_plugin(**kwargs):
+    plugin = FluxBurstComputeEngine(BurstParameters(project="project", **kwargs))
+    plugin.node_count = 3
+    return plugin
+
+
+def test_replace_preempted():
+    plugin = get_plugin()
+    source = preemption.SimulatedPreemptionSource()
+    resized = []
+
+    # Nothing preempted, nothing to replace
+    assert plugin.replace_preempted(source, resize=resized.append) == []
+    assert not resized
+
+    source.preempt("gffw-compute-a-002", preempted_at=time.time() - 10)
+    replaced = plugin.replace_preempted(source, resize=resized.append)
+    assert replaced == ["gffw-compute-a-002"]
+    assert source.released == ["gffw-compute-a-002"]
+    assert not source.preempted()
+    assert resized == [3]
+
+    stats = plugin.preemption_stats()
+    assert stats["preemptions"] == 1
+    assert stats["latency_max"] >= 10
+    assert stats["latency_mean"] == stats["latency_max"]
+
+
+def test_watch_preemptions_survives_errors():
+    plugin = get_plugin()
+    source = preemption.SimulatedPreemptionSource()
+    source.preempt("gffw-compute-a-001")
+
+    def failed_resize(node_count):
+        raise ValueError("terraform apply failed")
+
+    stats = plugin.watch_preemptions(
+        interval=0, timeout=0, source=source, resize=failed_resize
+    )
+    assert stats["preemptions"] == 0
+
+    # Compute Engine would find the released instance missing on the next check
+    source.preempt("gffw-compute-a-001")
+    stats = plugin.watch_preemptions(
+        interval=0, timeout=0, source=source, resize=lambda node_count: None
+    )
+    assert stats["preemptions"] == 1
+
+
+def test_watch_preemptions_follows_target_size(monkeypatch):
+    plugin = get_plugin()
+    expected = []
+
+    def get_preemption_source():
+        expected.append(plugin.node_count)
+        return preemption.SimulatedPreemptionSource()
+
+    monkeypatch.setattr(plugin, "get_preemption_source", get_preemption_source)
+    plugin.watch_preemptions(interval=0, timeout=0)
+    plugin.node_count = 2
+    plugin.watch_preemptions(interval=0, timeout=0)
+    assert expected == [3, 2]
+
+
+def test_compute_engine_preemption_source(monkeypatch):
+    instances = [
+        {"name": "gffw-compute-a-001", "status": "RUNNING"},
+        {
+            "name": "gffw-compute-a-002",
+            "status": "TERMINATED",
+            "scheduling": {"provisioningModel": "SPOT"},
+            "lastStopTimestamp": "1970-01-01T00:01:00+00:00",
+        },
+    ]
+    deleted = []
+    monkeypatch.setattr(preemption.gcloud, "list_instances", lambda *args: instances)
+    monkeypatch.setattr(
+        preemption.gcloud,
+        "delete_instances",
+        lambda project, zone, names: deleted.extend(names),
+    )
+    expected = ["gffw-compute-a-001", "gffw-compute-a-002", "gffw-compute-a-003"]
+    source = preemption.ComputeEnginePreemptionSource(
+        "project", "zone", "gffw-compute-a", expected=expected
+    )
+    preempted = {x["name"]: x["preempted_at"] for x in source.preempted()}
+    assert preempted == {"gffw-compute-a-003": None, "gffw-compute-a-002": 60.0}
+
+    # Only instances that still exist are deleted
+    source.release(list(preempted))
+    assert deleted == ["gffw-compute-a-002"]
+
+
+def test_preemption_source_is_abstract():
+    class IncompleteSource(preemption.PreemptionSource):
+        def preempted(self):
+            return []
+
+    with pytest.raises(TypeError):
+        IncompleteSource()
+
+
+@pytest.mark.parametrize(
+    "kwargs,valid",
+    [
+        ({}, True),
+        ({"compute_spot_ratio": None}, True),
+        ({"compute_provisioning_model": "spot"}, True),
+        ({"compute_provisioning_model": "mixed", "compute_spot_ratio": "0.25"}, True),
+        ({"compute_provisioning_model": "mixed", "compute_spot_ratio": None}, False),
+        ({"compute_provisioning_model": "mixed", "compute_spot_ratio": "half"}, False),
+        ({"compute_provisioning_model": "mixed", "compute_spot_ratio": 2}, False),
+        ({"compute_provisioning_model": "reserved"}, False),
+    ],
+)
+def test_validate_provisioning(tmp_path, kwargs, valid):
+    plugin = get_plugin(isolated_burst=True, terraform_dir=str(tmp_path), **kwargs)
+    assert plugin.validate_params() == valid
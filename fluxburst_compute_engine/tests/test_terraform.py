@@ -0,0 +1,79 @@
+# Copyright 2023 Lawrence Livermore National Security, LLC and other
+# HPCIC DevTools Developers. See the top-level COPYRIGHT file for details.
+#
+# SPDX-License-Identifier: (MIT)
+
+import pytest
+
+import fluxburst_compute_engine.terraform as terraform
+from fluxburst_compute_engine.plugin import BurstParameters
+
+
+def get_params(**kwargs):
+    params = BurstParameters(project="project", **kwargs)
+    params.compute_boot_script = "#!/bin/sh"
+    return params
+
+
+@pytest.mark.parametrize(
+    "model,ratio,nodes,counts",
+    [
+        ("standard", 0.5, 4, {"standard": 4, "spot": 0}),
+        ("spot", 0.5, 4, {"standard": 0, "spot": 4}),
+        ("mixed", 0.5, 4, {"standard": 2, "spot": 2}),
+        ("mixed", 0.75, 4, {"standard": 1, "spot": 3}),
+        # Half rounds up
+        ("mixed", 0.5, 1, {"standard": 0, "spot": 1}),
+        ("mixed", 0.5, 5, {"standard": 2, "spot": 3}),
+        ("mixed", 0.0, 3, {"standard": 3, "spot": 0}),
+        ("mixed", 1.0, 3, {"standard": 0, "spot": 3}),
+    ],
+)
+def test_split_provisioning(model, ratio, nodes, counts):
+    params = get_params(compute_provisioning_model=model, compute_spot_ratio=ratio)
+    assert terraform.split_provisioning(params, nodes) == counts
+
+
+def test_instance_names():
+    params = get_params()
+    assert terraform.get_instance_names(params, 2) == [
+        "gffw-compute-a-001",
+        "gffw-compute-a-002",
+    ]
+
+    # Spot only nodes keep the compute name prefix
+    params = get_params(compute_provisioning_model="spot")
+    assert terraform.get_instance_names(params, 1) == ["gffw-compute-a-001"]
+
+    params = get_params(compute_provisioning_model="mixed", compute_spot_ratio=0.5)
+    assert terraform.get_instance_names(params, 3) == [
+        "gffw-compute-a-001",
+        "gffw-compute-a-spot-001",
+        "gffw-compute-a-spot-002",
+    ]
+
+
+def test_generate_variables():
+    params = get_params()
+    variables = terraform.generate_variables(params, 2)
+    assert [x["instances"] for x in variables["compute_node_specs"]] == [2]
+    assert variables["spot_node_specs"] == []
+
+    params = get_params(compute_provisioning_model="mixed", compute_spot_ratio=0.5)
+    variables = terraform.generate_variables(params, 5)
+    (standard,) = variables["compute_node_specs"]
+    (spot,) = variables["spot_node_specs"]
+    assert standard["name_prefix"] == "gffw-compute-a"
+    assert standard["instances"] == 2
+    assert spot == {
+        "name_prefix": "gffw-compute-a-spot",
+        "machine_type": "c2-standard-8",
+        "instances": 3,
+        "boot_script": "#!/bin/sh",
+        "termination_action": "STOP",
+    }
+
+    params = get_params(compute_provisioning_model="spot")
+    variables = terraform.generate_variables(params, 3)
+    assert variables["compute_node_specs"] == []
+    assert variables["spot_node_specs"][0]["instances"] == 3
@@ -0,0 +1,53 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Spot compute nodes are created here (the cluster module only creates
+# standard instances), with the same image family, network, and tags.
+
+data "google_compute_image" "compute" {
+    project = var.project_id
+    family  = var.compute_family
+}
+
+module "spot_instance_template" {
+    source                           = "github.com/terraform-google-modules/terraform-google-vm/modules/instance_template"
+    for_each                         = { for spec in var.spot_node_specs : spec.name_prefix => spec }
+    region                           = var.region
+    project_id                       = var.project_id
+    name_prefix                      = each.value.name_prefix
+    subnetwork                       = module.network.subnets_self_links[0]
+    tags                             = ["ssh", "flux"]
+    machine_type                     = each.value.machine_type
+    source_image                     = data.google_compute_image.compute.self_link
+    source_image_project             = data.google_compute_image.compute.project
+    service_account                  = {
+        email  = data.google_compute_default_service_account.default.email
+        scopes = var.compute_scopes
+    }
+    spot                             = true
+    spot_instance_termination_action = each.value.termination_action
+    startup_script                   = each.value.boot_script
+}
+
+module "spot_instance" {
+    source              = "github.com/terraform-google-modules/terraform-google-vm/modules/compute_instance"
+    for_each            = { for spec in var.spot_node_specs : spec.name_prefix => spec }
+    region              = var.region
+    zone                = var.zone
+    hostname            = each.value.name_prefix
+    add_hostname_suffix = true
+    num_instances       = each.value.instances
+    instance_template   = module.spot_instance_template[each.key].self_link
+    subnetwork          = module.network.subnets_self_links[0]
+}
@@ -28,6 +28,18 @@ variable "compute_node_specs" {
     default = []
 }
 
+variable "spot_node_specs" {
+    description = "A list of Spot compute node specifications"
+    type = list(object({
+       name_prefix        = string
+       machine_type       = string
+       instances          = number
+       boot_script        = string
+       termination_action = string
+    }))
+    default = []
+}
+
 variable "compute_scopes" {
     description = "The set of access scopes for compute node instances"
     default     = [ "cloud-platform" ]